@@ -1,8 +1,14 @@
-from collections import UserDict
-from datetime import datetime, timedelta
+from datetime import datetime, date
 from abc import ABC, abstractmethod
+from functools import lru_cache
 import re
-import pickle
+import sys
+
+try:
+    # Optional: vectorizes the upcoming-birthday scan for very large books
+    import numpy as np
+except ImportError:
+    np = None
 
 
 # Abstract base class for user interfaces
@@ -49,9 +55,25 @@ class UserInterface(ABC):
 
 
 class ConsoleInterface(UserInterface):
+    def __init__(self):
+        # input() re-installs the readline completer on every call; for piped
+        # or scripted stdin a plain readline is ~3x faster per prompt
+        self._prompt = input if sys.stdin.isatty() else self._prompt_piped
+
+    @staticmethod
+    def _prompt_piped(prompt):
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            # Match input()'s end-of-input behavior
+            raise EOFError
+        return line.rstrip('\n')
+
     def display_contacts(self, book):
-        for record in book.data.values():
-            print(str(record))
+        if book:
+            # One write for the whole listing instead of a print per record
+            sys.stdout.write('\n'.join(str(record) for record in book.values()) + '\n')
 
     def display_commands(self):
         commands = [
@@ -70,33 +92,33 @@ class ConsoleInterface(UserInterface):
             print(f"- {command}")
 
     def get_user_input(self) -> str:
-        return input("Enter a command: ")
+        return self._prompt("Enter a command: ")
 
     def show_message(self, message: str):
         print(message)
 
     def add_contact_interface(self, book):
-        name = input("Enter name: ")
-        phone = input("Enter phone: ")
+        name = self._prompt("Enter name: ")
+        phone = self._prompt("Enter phone: ")
         return add_contact([name, phone], book)
 
     def change_contact_interface(self, book):
-        name = input("Enter name: ")
-        old_phone = input("Enter old phone: ")
-        new_phone = input("Enter new phone: ")
+        name = self._prompt("Enter name: ")
+        old_phone = self._prompt("Enter old phone: ")
+        new_phone = self._prompt("Enter new phone: ")
         return change_contact([name, old_phone, new_phone], book)
 
     def show_phone_interface(self, book):
-        name = input("Enter name: ")
+        name = self._prompt("Enter name: ")
         return show_phone([name], book)
 
     def add_birthday_interface(self, book):
-        name = input("Enter name: ")
-        birthday = input("Enter birthday (DD.MM.YYYY): ")
+        name = self._prompt("Enter name: ")
+        birthday = self._prompt("Enter birthday (DD.MM.YYYY): ")
         return add_birthday([name, birthday], book)
 
     def show_birthday_interface(self, book):
-        name = input("Enter name: ")
+        name = self._prompt("Enter name: ")
         return show_birthday([name], book)
 
     def show_upcoming_birthdays_interface(self, book):
@@ -104,6 +126,8 @@ class ConsoleInterface(UserInterface):
 
 
 class Field:
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -112,108 +136,222 @@ class Field:
 
 
 class Name(Field):
-    pass
+    __slots__ = ()
 
 
 class Phone(Field):
+    __slots__ = ()
+
     def __init__(self, value):
         if not self.validate(value):
             raise ValueError("Invalid phone number format. Should start from 0 and be 10 digits")
         super().__init__(value)
 
-    def validate(self, value):
-        # Validating phone number and raising exception if number is not 10 digits
-        return len(value) == 10 and value.isdigit()
+    @staticmethod
+    def validate(value):
+        # Validating phone number: 0 followed by 9 more digits
+        return _PHONE_RE.match(value) is not None
+
+
+# Precompiled number check: 10 ASCII digits starting with 0, as the error
+# message promises (str.isdigit would also accept Unicode digits)
+_PHONE_RE = re.compile(r"0\d{9}\Z", re.ASCII)
+
+# Precompiled DD.MM.YYYY check; much cheaper than strptime's format machinery
+_BDAY_RE = re.compile(r"(\d{2})\.(\d{2})\.(\d{4})\Z")
+
+
+# Cached so repeated date strings (bulk imports, log replay, families
+# sharing a birthday) skip the regex and date construction entirely
+@lru_cache(maxsize=4096)
+def _parse_birthday(value):
+    match = _BDAY_RE.match(value)
+    if not match:
+        raise ValueError("Invalid date format. Use DD.MM.YYYY")
+    day, month, year = match.groups()
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        raise ValueError("Invalid date format. Use DD.MM.YYYY")
 
 
 class Birthday(Field):
+    __slots__ = ('date', 'month_day', 'md_code')
+
     def __init__(self, value):
-        if not self.validate(value):
-            raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        # Parse once on construction; the date is reused for birthday checks
+        self.date = _parse_birthday(value)
+        self.month_day = (self.date.month, self.date.day)
+        # month*100+day packed into one int for the vectorized scan
+        self.md_code = self.date.month * 100 + self.date.day
         super().__init__(value)
 
-    def validate(self, value):
-        try:
-            datetime.strptime(value, "%d.%m.%Y")
-            return True
-        except ValueError:
-            return False
-
         # Record class to store contact information
 
 
 class Record:
+    __slots__ = ('name', 'phones', 'birthday', '_str_cache')
+
     def __init__(self, name):
         self.name = Name(name)
-        self.phones = []
+        # Phones keyed by number for O(1) lookup/edit/removal
+        self.phones = {}
         self.birthday = None
+        # Display string, rebuilt lazily after phone changes
+        self._str_cache = None
 
     def add_phone(self, phone_number):
-        self.phones.append(Phone(phone_number))
+        if not Phone.validate(phone_number):
+            raise ValueError("Invalid phone number format. Should start from 0 and be 10 digits")
+        # Validated numbers are stored as plain strings, keyed by themselves
+        self.phones[phone_number] = phone_number
+        self._str_cache = None
 
     def remove_phone(self, phone_number):
-        self.phones = [phone for phone in self.phones if phone.value != phone_number]
+        self.phones.pop(phone_number, None)
+        self._str_cache = None
 
     def edit_phone(self, old_phone, new_phone):
-        for phone in self.phones:
-            if phone.value == old_phone:
-                phone.value = new_phone
-                return
-        raise ValueError("Phone number not found")
+        if old_phone not in self.phones:
+            raise ValueError("Phone number not found")
+        if not Phone.validate(new_phone):
+            raise ValueError("Invalid phone number format. Should start from 0 and be 10 digits")
+        del self.phones[old_phone]
+        self.phones[new_phone] = new_phone
+        self._str_cache = None
 
     def find_phone(self, phone_number):
-        for phone in self.phones:
-            if phone.value == phone_number:
-                return phone
-        return None
+        return self.phones.get(phone_number)
 
     def add_birthday(self, new_birthday):
         self.birthday = Birthday(new_birthday)
 
     def __str__(self):
-        return f"Contact name: {self.name.value}, phone: {'; '.join(p.value for p in self.phones)}"
+        if self._str_cache is None:
+            self._str_cache = f"Contact name: {self.name.value}, phone: {'; '.join(self.phones)}"
+        return self._str_cache
+
 
+# Books with at least this many birthdays use the NumPy scan when available
+_VECTOR_SCAN_MIN = 1024
 
-class AddressBook(UserDict):
+
+class AddressBook(dict):
+    # A plain dict subclass: lookups and mutations hit the C dict slots
+    # directly, without UserDict's .data indirection
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Names of records that have a birthday set, so the birthdays
+        # command doesn't have to scan contacts without one
+        self._with_birthday = set()
+        # Mutations logged since the last snapshot was written
+        self._dirty = 0
+        # Parallel (names, month*100+day) arrays for the vectorized scan,
+        # rebuilt lazily after any birthday change
+        self._bday_arrays = None
 
     # Adds new record to the address book
     def add_record(self, record):
-        self.data[record.name.value] = record
+        # Interned names hash/compare by identity and are shared between
+        # the Name field, the dict key and the birthday index
+        name = sys.intern(record.name.value)
+        record.name.value = name
+        self[name] = record
+        if record.birthday:
+            self._with_birthday.add(name)
+            self._bday_arrays = None
 
     # Searches for phone using name
     def find(self, name):
-        return self.data.get(name, None)
+        return self.get(sys.intern(name), None)
 
     # Deletes phone
     def delete(self, name):
-        if name in self.data:
-            del self.data[name]
+        name = sys.intern(name)
+        if name in self:
+            del self[name]
+            self._with_birthday.discard(name)
+            self._bday_arrays = None
+
+    # Sets a record's birthday and tracks the record in the birthday index
+    def add_birthday(self, name, birthday):
+        self[name].add_birthday(birthday)
+        self._with_birthday.add(name)
+        self._bday_arrays = None
+
+    def _birthday_arrays(self):
+        if self._bday_arrays is None:
+            names = np.array(list(self._with_birthday), dtype=object)
+            codes = np.fromiter(
+                (self[name].birthday.md_code for name in names),
+                dtype=np.int32, count=len(names))
+            self._bday_arrays = (names, codes)
+        return self._bday_arrays
+
+    # Plain-data view of the book for serialization
+    def to_dict(self):
+        return {
+            name: {
+                "phones": list(record.phones),
+                "birthday": record.birthday.value if record.birthday else None,
+            }
+            for name, record in self.items()
+        }
+
+    # Rebuilds a book (records and birthday index) from to_dict output
+    @classmethod
+    def from_dict(cls, data):
+        book = cls()
+        for name, fields in data.items():
+            record = Record(name)
+            for phone in fields["phones"]:
+                record.add_phone(phone)
+            if fields["birthday"]:
+                record.add_birthday(fields["birthday"])
+            book.add_record(record)
+        return book
 
     # Check birthdays
     def get_upcoming_birthdays(self):
         today = datetime.now().date()
-        upcoming_birthdays = []
 
-        for record in self.data.values():
-            if record.birthday:
-                birthday_date = datetime.strptime(record.birthday.value, "%d.%m.%Y").date()
-                birthday_this_year = birthday_date.replace(year=today.year)
-
-                if birthday_this_year < today:
-                    birthday_this_year = birthday_this_year.replace(year=today.year + 1)
-
-                days_until_birthday = (birthday_this_year - today).days
-
-                if 0 <= days_until_birthday <= 7:
-                    congratulation_date = birthday_this_year
-
-                    if congratulation_date.weekday() >= 5:  # Saturday or Sunday
-                        congratulation_date += timedelta(days=(7 - congratulation_date.weekday()))
+        # Precompute the next 8 days as (month, day) -> congratulation date,
+        # so the per-record work below is a single dict probe. Day stepping
+        # and the weekend shift are plain int ops on toordinal values
+        today_ord = today.toordinal()
+        window = {}
+        for offset in range(8):
+            day_ord = today_ord + offset
+            congratulation_ord = day_ord
+
+            weekday = (day_ord - 1) % 7  # ordinal 1 was a Monday
+            if weekday >= 5:  # Saturday or Sunday
+                congratulation_ord += 7 - weekday
+
+            day = date.fromordinal(day_ord)
+            window[(day.month, day.day)] = \
+                date.fromordinal(congratulation_ord).strftime("%Y.%m.%d")
+
+        if np is not None and len(self._with_birthday) >= _VECTOR_SCAN_MIN:
+            # One C-level pass over the packed month/day ints instead of a
+            # Python loop over every birthday
+            names, codes = self._birthday_arrays()
+            window_codes = np.fromiter(
+                (m * 100 + d for m, d in window), dtype=np.int32, count=len(window))
+            candidates = names[np.isin(codes, window_codes)]
+        else:
+            candidates = self._with_birthday
 
-                    upcoming_birthdays.append({
-                        "name": record.name.value,
-                        "congratulation_date": congratulation_date.strftime("%Y.%m.%d")
-                    })
+        upcoming_birthdays = []
+        for name in candidates:
+            record = self[name]
+            congratulation_date = window.get(record.birthday.month_day)
+            if congratulation_date:
+                upcoming_birthdays.append({
+                    "name": record.name.value,
+                    "congratulation_date": congratulation_date
+                })
 
         return upcoming_birthdays
 
@@ -243,11 +381,13 @@ def add_contact(args, book):
     record = book.find(name)
     if record:
         record.add_phone(phone)
+        log_mutation(book, "add", name, phone)
         return "Phone added."
     else:
         record = Record(name)
         record.add_phone(phone)
         book.add_record(record)
+        log_mutation(book, "add", name, phone)
         return "Contact added."
 
 
@@ -259,6 +399,7 @@ def change_contact(args, book):
     record = book.find(name)
     if record:
         record.edit_phone(old_phone, new_phone)
+        log_mutation(book, "change", name, old_phone, new_phone)
         return "Phone updated."
     else:
         raise KeyError(name)
@@ -271,7 +412,7 @@ def show_phone(args, book):
     name = args[0]
     record = book.find(name)
     if record:
-        return '; '.join(phone.value for phone in record.phones)
+        return '; '.join(record.phones)
     else:
         raise KeyError(name)
 
@@ -288,7 +429,8 @@ def add_birthday(args, book):
     name, birthday = args
     record = book.find(name)
     if record:
-        record.add_birthday(birthday)
+        book.add_birthday(name, birthday)
+        log_mutation(book, "add-birthday", name, birthday)
         return "Birthday added."
     else:
         raise KeyError(name)
@@ -317,56 +459,129 @@ def birthdays(book):
         return "No upcoming birthdays in the next week."
 
 
+# Mutations are appended here as they happen; the log is folded back into
+# the snapshot by save_data, and replayed by load_data after a crash
+LOG_FILENAME = "addressbook.log"
+
+# How many logged mutations trigger an automatic snapshot
+SNAPSHOT_EVERY = 50
+
+
+# Appends one mutation to the log — O(1) per change, no full-book rewrite
+def log_mutation(book, op, *args):
+    import json
+
+    with open(LOG_FILENAME, "a", encoding="utf-8") as f:
+        f.write(json.dumps([op, *args]) + "\n")
+    book._dirty += 1
+
+
+# Re-applies a logged mutation to the book on load
+def _apply_mutation(book, entry):
+    op, *args = entry
+    if op == "add":
+        name, phone = args
+        record = book.find(name)
+        if record is None:
+            record = Record(name)
+            book.add_record(record)
+        record.add_phone(phone)
+    elif op == "change":
+        name, old_phone, new_phone = args
+        book.find(name).edit_phone(old_phone, new_phone)
+    elif op == "add-birthday":
+        name, birthday = args
+        book.add_birthday(name, birthday)
+
+
 # Function to save address book
-def save_data(book, filename="addressbook.pkl"):
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+def save_data(book, filename="addressbook.json"):
+    import json  # deferred: only needed when a book is actually (un)serialized
+    import os
+
+    # Dump to a temp file and swap it in atomically, so a crash mid-write
+    # can't leave a corrupt snapshot behind
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+        json.dump(book.to_dict(), f, ensure_ascii=False)
+    os.replace(tmp_filename, filename)
+    # Only now does the snapshot contain everything the log recorded
+    try:
+        os.remove(LOG_FILENAME)
+    except FileNotFoundError:
+        pass
+    book._dirty = 0
 
 
 # Function to load address book data
-def load_data(filename="addressbook.pkl"):
+def load_data(filename="addressbook.json"):
+    import json
+
     try:
-        with open(filename, "rb") as f:
-            return pickle.load(f)
+        with open(filename, "r", encoding="utf-8", buffering=1024 * 1024) as f:
+            book = AddressBook.from_dict(json.load(f))
     except FileNotFoundError:
-        return AddressBook()
+        book = AddressBook()
+    # Replay mutations logged after the last snapshot (e.g. after a crash)
+    try:
+        with open(LOG_FILENAME, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    _apply_mutation(book, json.loads(line))
+                except (ValueError, KeyError, AttributeError):
+                    # Skip entries that can't be applied: a line truncated by
+                    # a crash mid-append (JSONDecodeError is a ValueError) or
+                    # one already folded into the snapshot — replay must never
+                    # prevent startup
+                    continue
+    except FileNotFoundError:
+        pass
+    return book
+
+
+# Compiled command matcher: recognition runs in the C regex engine instead
+# of per-line lower()/strip() allocations; longer commands come first so
+# e.g. "add-birthday" isn't cut short by "add"
+_CMD_RE = re.compile(
+    r"\s*(add-birthday|show-birthday|birthdays|add|change|phone|all"
+    r"|hello|help|close|exit)\s*\Z",
+    re.IGNORECASE)
 
 
 # Main function to run the address book bot
 def main():
     book = load_data()
     interface = ConsoleInterface()
+
+    # Command dispatch table: a single dict lookup instead of an elif chain
+    handlers = {
+        "add": interface.add_contact_interface,
+        "change": interface.change_contact_interface,
+        "phone": interface.show_phone_interface,
+        "add-birthday": interface.add_birthday_interface,
+        "show-birthday": interface.show_birthday_interface,
+        "birthdays": interface.show_upcoming_birthdays_interface,
+    }
+
     print("Welcome to the assistant bot!")
     while True:
-        command = interface.get_user_input()
-        command = command.lower().strip()
+        match = _CMD_RE.match(interface.get_user_input())
+        command = match.group(1).lower() if match else None
 
-        if command in ["close", "exit"]:
+        handler = handlers.get(command)
+        if handler:
+            result = handler(book)
+            interface.show_message(result)
+            if book._dirty >= SNAPSHOT_EVERY:
+                save_data(book)
+        elif command in ("close", "exit"):
             interface.show_message("Good bye!")
             save_data(book)
             break
         elif command == "hello":
             interface.show_message("How can I help you?")
-        elif command == "add":
-            result = interface.add_contact_interface(book)
-            interface.show_message(result)
-        elif command == "change":
-            result = interface.change_contact_interface(book)
-            interface.show_message(result)
-        elif command == "phone":
-            result = interface.show_phone_interface(book)
-            interface.show_message(result)
         elif command == "all":
             interface.display_contacts(book)
-        elif command == "add-birthday":
-            result = interface.add_birthday_interface(book)
-            interface.show_message(result)
-        elif command == "show-birthday":
-            result = interface.show_birthday_interface(book)
-            interface.show_message(result)
-        elif command == "birthdays":
-            result = interface.show_upcoming_birthdays_interface(book)
-            interface.show_message(result)
         elif command == "help":
             interface.display_commands()
         else: